@@ -3,9 +3,26 @@
 import json
 import logging
 import asyncio
-from typing import Callable, Any, Dict
+from typing import Callable, Any, Dict, Optional, Set
 from pathlib import Path
 
+# orjson is optional: it round-trips the config straight to/from bytes, several times
+# faster than the stdlib. Both paths emit the same 2-space indented layout.
+try:
+    import orjson
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
 log = logging.getLogger(__name__)
 
 
@@ -19,10 +36,25 @@ class SelfModificationController:
     event loop without blocking.
     """
 
-    def __init__(self, config_path: str, meta_function: Callable[..., Any]):
+    def __init__(self, config_path: str, meta_function: Callable[..., Any], load_config: bool = True):
         self.config_path = Path(config_path)
         self.meta_function = meta_function
-        self.config = self._load_or_create_config()
+        # mtime of the config as last read; request_permission only re-reads when it changes.
+        self._config_mtime_ns: Optional[int] = None
+        self.config: Dict[str, Any] = self._load_or_create_config() if load_config else {}
+        # Strong references to in-flight meta-function tasks; the event loop only keeps
+        # weak references, so an untracked task can be garbage-collected mid-run.
+        self._pending: Set[asyncio.Task] = set()
+
+    @classmethod
+    async def create(cls, config_path: str, meta_function: Callable[..., Any]) -> "SelfModificationController":
+        """
+        Async factory that performs the initial config read off the event loop, so
+        constructing the controller never blocks the GUI thread on disk I/O.
+        """
+        controller = cls(config_path, meta_function, load_config=False)
+        controller.config = await asyncio.to_thread(controller._load_or_create_config)
+        return controller
 
     def _get_default_config(self) -> Dict[str, Any]:
         """Returns the default configuration dictionary, ensuring evolution is on by default."""
@@ -39,12 +71,12 @@ class SelfModificationController:
                 log.warning(
                     f"Configuration file not found at '{self.config_path}'. Creating default config with self-modification ENABLED.")
                 default_config = self._get_default_config()
-                with self.config_path.open('w', encoding='utf-8') as f:
-                    json.dump(default_config, f, indent=4)
+                self.config_path.write_bytes(_json_dumps(default_config))
+                self._config_mtime_ns = self.config_path.stat().st_mtime_ns
                 return default_config
 
-            with self.config_path.open('r', encoding='utf-8') as f:
-                config = json.load(f)
+            self._config_mtime_ns = self.config_path.stat().st_mtime_ns
+            config = _json_loads(self.config_path.read_bytes())
             log.info("Self-modification controller config loaded successfully.")
             return config
         except (IOError, json.JSONDecodeError) as e:
@@ -52,8 +84,19 @@ class SelfModificationController:
             # Fallback to a safe, in-memory default if file I/O fails completely.
             return {"allow_self_modification": False}
 
+    def _refresh_config_if_changed(self):
+        """Re-reads the configuration only if the file's mtime changed since the last read."""
+        try:
+            mtime_ns = self.config_path.stat().st_mtime_ns
+        except OSError:
+            return  # Keep the last known configuration if the file is unreachable.
+        if mtime_ns != self._config_mtime_ns:
+            log.info("Self-modification config changed on disk; reloading.")
+            self.config = self._load_or_create_config()
+
     def request_permission(self) -> bool:
-        """Checks the loaded configuration for permission to self-modify."""
+        """Checks the current configuration for permission to self-modify."""
+        self._refresh_config_if_changed()
         # Default to False for maximum safety if the key is somehow missing after a failed load.
         status = self.config.get("allow_self_modification", True)
         log.info(f"Permission check: allow_self_modification = {status}")
@@ -69,8 +112,20 @@ class SelfModificationController:
             try:
                 # Schedule the async meta_function to run on the event loop
                 # without blocking the caller (e.g., the GUI thread).
-                asyncio.create_task(self.meta_function(**kwargs))
+                task = asyncio.create_task(self.meta_function(**kwargs))
+                self._pending.add(task)
+                task.add_done_callback(self._on_meta_function_done)
             except Exception as e:
                 log.critical("Failed to schedule meta-function on the event loop.", exc_info=e)
         else:
             log.warning("DENIED: Self-modification is disabled in the current configuration.")
+
+    def _on_meta_function_done(self, task: asyncio.Task):
+        """Releases a finished meta-function task and surfaces any exception it raised."""
+        self._pending.discard(task)
+        if task.cancelled():
+            log.warning("Self-modification meta-function was cancelled before completion.")
+            return
+        exc = task.exception()
+        if exc is not None:
+            log.error("Self-modification meta-function failed.", exc_info=exc)
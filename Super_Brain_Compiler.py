@@ -6,34 +6,80 @@ import yaml
 import asyncio
 import logging
 import time
+import pickle
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, List, Any, Tuple, Union
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Union
 
-import aiofiles
 from tqdm.asyncio import tqdm
 
+# Prefer LibYAML's C bindings; the pure-Python loader/dumper is an order of magnitude slower.
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
 # --- Path Setup & Logging Configuration ---
 ROOT_DIR = Path(__file__).resolve().parent
 YAML_BRAIN_SOURCE_DIR = ROOT_DIR / "YAML_Brain"
 OUTPUT_FILE = ROOT_DIR / "Super_Brain.yaml"
 
-# Configure professional, leveled logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] [%(name)s] %(message)s",
-    handlers=[
-        logging.FileHandler(ROOT_DIR / "Logs" / "super_brain_compiler.log", mode='w'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+
+def _in_parse_worker() -> bool:
+    """
+    True inside a spawned worker process, including while it is still re-importing the
+    caller's __main__. During that bootstrap parent_process() is not yet set, but the
+    module being imported is registered as __mp_main__, which in the parent process is
+    simply an alias of __main__.
+    """
+    bootstrapping = sys.modules.get('__mp_main__') is not sys.modules.get('__main__')
+    return bootstrapping or multiprocessing.parent_process() is not None
+
+
+# Configure professional, leveled logging. Parse workers spawned by the process pool
+# re-import this module; only the parent process may own (and truncate) the log file.
+if not _in_parse_worker():
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] [%(name)s] %(message)s",
+        handlers=[
+            logging.FileHandler(ROOT_DIR / "Logs" / "super_brain_compiler.log", mode='w'),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
 log = logging.getLogger(__name__)
+log.info(f"YAML backend: {'LibYAML (C)' if yaml.__with_libyaml__ else 'pure Python'}")
+
+
+# Number of files read and parsed per executor hop. Batching amortizes the per-file
+# scheduling and open/read overhead that dominates on a corpus of many small fragments.
+READ_BATCH_SIZE = 64
+# Parsing is CPU-bound and holds the GIL, so batches are parsed in worker processes.
+PARSE_POOL_WORKERS = os.cpu_count() or 1
+# Below this many batches (e.g. an incremental compile of a few changed files), starting
+# worker processes costs more than it saves, so the batches are parsed on threads.
+PROCESS_POOL_MIN_BATCHES = 4
+# Workers are spawned as fresh interpreters rather than forked from this one: forking a
+# process that already runs threads (the agent, pytest) can deadlock. "forkserver" is not
+# used because its server process re-imports this module without a parent process and
+# would re-run the logging setup above, truncating the log file. Like every start method
+# but fork, spawn re-imports the caller's __main__ in each worker: callers that use the
+# process pool must keep the compile behind an `if __name__ == "__main__":` guard in an
+# import-light entry point, or pass use_processes=False.
+PARSE_POOL_START_METHOD = "spawn"
+# Dedicated thread pool used when worker processes are unavailable, so a compile never
+# competes with (or starves) other users of the event loop's default executor.
+IO_POOL_WORKERS = min(32, (os.cpu_count() or 1) + 4)
 
 
 # ... (FileProcessingSuccess, FileProcessingFailure, ProcessingResult classes are unchanged and perfect as they are) ...
 class FileProcessingSuccess:
-    def __init__(self, key_path: List[str], data: Dict[str, Any]):
+    def __init__(self, key_path: List[str], data: Dict[str, Any], path: Optional[str] = None):
         self.key_path = key_path
         self.data = data
+        self.path = path
 
 
 class FileProcessingFailure:
@@ -44,84 +90,266 @@ class FileProcessingFailure:
 
 ProcessingResult = Union[FileProcessingSuccess, FileProcessingFailure]
 
+# Compile cache entry: file path -> ((st_mtime_ns, st_size), key_path, parsed_data)
+FileSignature = Tuple[int, int]
+CacheEntry = Tuple[FileSignature, List[str], Any]
+
+
+def _scan_yaml_files(directory: str) -> Iterator[os.DirEntry]:
+    """
+    Recursively yields the YAML file entries under a directory. Entry types come from
+    the directory listing itself, so no extra stat is issued per candidate file.
+    A directory that cannot be listed (unreadable, or removed mid-scan) is logged
+    and skipped rather than aborting the whole compile.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scan_yaml_files(entry.path)
+                elif entry.name.endswith('.yaml') and entry.is_file():
+                    yield entry
+    except OSError as e:
+        log.warning(f"Skipping unreadable directory {directory}: {e}")
+
+
+def _read_and_parse_one_file(file_path: str, prefix_len: int) -> Tuple[List[str], Any]:
+    """
+    Reads and parses a single YAML file, returning a key path. The key path is sliced
+    straight out of the path string (prefix_len strips the source directory), which
+    avoids building intermediate PurePath objects for every file.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            parsed_data = yaml.load(f.read(), Loader=_Loader)
+
+        # Create a key path from the directory structure. Segments are interned so
+        # sibling files share one str object per directory name.
+        parts = file_path[prefix_len:].split(os.sep)
+        key_path = [sys.intern(part) for part in parts[:-1]] + [sys.intern(parts[-1].rsplit('.', 1)[0])]
+
+        return key_path, parsed_data or {}
+    except (yaml.YAMLError, IOError) as e:
+        # Not logged here: in a spawned worker the log file is not configured. The
+        # parent logs every failure when it folds the batch results.
+        raise ValueError(f"Error in {os.path.basename(file_path)}: {e}")
+
+
+def _process_file_batch(file_paths: List[str], prefix_len: int) -> List[ProcessingResult]:
+    """A safe worker that reads and parses a whole batch of files in one executor hop."""
+    results: List[ProcessingResult] = []
+    for file_path in file_paths:
+        try:
+            key_path, data = _read_and_parse_one_file(file_path, prefix_len)
+            results.append(FileProcessingSuccess(key_path, data, file_path))
+        except Exception as e:
+            results.append(FileProcessingFailure(Path(file_path), str(e)))
+    return results
+
 
 class SuperBrainCompiler:
     """
     Encapsulates the logic for compiling the YAML_Brain into a unified structure.
     This version correctly handles nested directory structures, creating a
     hierarchical dictionary that mirrors the file system.
+
+    With use_processes=True, parsing runs in spawned worker processes, and each one
+    re-imports the calling program's __main__ module. Run the compile from behind an
+    `if __name__ == "__main__":` guard in a module that is cheap to import; heavy
+    in-process callers (the agent, the GUI) should pass use_processes=False.
     """
 
-    def __init__(self, source_dir: Path, output_file: Path, max_concurrency: int = 100):
+    def __init__(self, source_dir: Path, output_file: Path, max_concurrency: int = 100, use_processes: bool = True):
         self.source_dir = source_dir
         self.output_file = output_file
+        # Length of the source directory prefix (plus separator) on every file path string.
+        self._prefix_len = len(str(source_dir)) + 1
+        self.use_processes = use_processes
+        # Parsed fragments from the previous run, so unchanged files are never re-read.
+        self.cache_file = output_file.with_suffix(".cache")
         self.semaphore = asyncio.Semaphore(max_concurrency)
         if not self.source_dir.is_dir():
             raise FileNotFoundError(f"Source directory not found: {self.source_dir}")
 
-    async def _read_and_parse_one_file(self, file_path: Path) -> Tuple[List[str], Any]:
-        """Asynchronously reads and parses a single YAML file, returning a key path."""
-        async with self.semaphore:
-            try:
-                async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
-                    content = await f.read()
-                loop = asyncio.get_running_loop()
-                parsed_data = await loop.run_in_executor(None, yaml.safe_load, content)
-
-                # Create a key path from the directory structure
-                relative_path = file_path.relative_to(self.source_dir)
-                key_path = list(relative_path.parts[:-1]) + [relative_path.stem]
-
-                return key_path, parsed_data or {}
-            except (yaml.YAMLError, IOError) as e:
-                log.warning(f"Error processing {file_path.name}: {e}")
-                raise ValueError(f"Error in {file_path.name}: {e}")
-
-    async def _process_file_worker(self, file_path: Path) -> ProcessingResult:
-        """A safe worker that wraps the core logic."""
+    def _load_cache(self) -> Dict[str, CacheEntry]:
+        """Loads the previous run's parsed fragments, treating any unreadable cache as empty."""
+        try:
+            with open(self.cache_file, 'rb') as f:
+                cache = pickle.load(f)
+            return cache if isinstance(cache, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            log.warning(f"Ignoring unreadable compile cache {self.cache_file.name}: {e}")
+            return {}
+
+    def _save_cache(self, cache: Dict[str, CacheEntry]):
+        """Atomically replaces the compile cache so an interrupted write never corrupts it."""
+        tmp_file = self.cache_file.with_name(self.cache_file.name + ".tmp")
         try:
-            key_path, data = await self._read_and_parse_one_file(file_path)
-            return FileProcessingSuccess(key_path, data)
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, self.cache_file)
         except Exception as e:
-            return FileProcessingFailure(file_path, str(e))
+            log.warning(f"Could not write compile cache {self.cache_file.name}: {e}")
+
+    def _create_parse_pool(self, batch_count: int) -> Executor:
+        """
+        Prefers worker processes so parsing escapes the GIL, falling back to threads for
+        small workloads or when processes are unavailable. Never starts more workers
+        than there are batches to parse.
+        """
+        # A spawned worker re-importing an unguarded __main__ must never start a pool of
+        # its own; multiprocessing raises during bootstrap if it tries.
+        if self.use_processes and not _in_parse_worker() and batch_count >= PROCESS_POOL_MIN_BATCHES:
+            try:
+                return ProcessPoolExecutor(max_workers=min(PARSE_POOL_WORKERS, batch_count),
+                                           mp_context=multiprocessing.get_context(PARSE_POOL_START_METHOD))
+            except (OSError, NotImplementedError, ValueError) as e:
+                log.warning(f"Process pool unavailable ({e}); parsing on threads instead.")
+        return ThreadPoolExecutor(max_workers=min(IO_POOL_WORKERS, batch_count), thread_name_prefix="brain-io")
+
+    async def _process_batch_worker(self, file_paths: List[str], pool: Executor) -> List[ProcessingResult]:
+        """Reads and parses a batch of files with a single hop onto the parse pool."""
+        async with self.semaphore:
+            loop = asyncio.get_running_loop()
+            try:
+                return await loop.run_in_executor(pool, _process_file_batch, file_paths, self._prefix_len)
+            except (BrokenProcessPool, RuntimeError, pickle.PicklingError, TypeError) as e:
+                # A worker that died, failed to start (spawn bootstrap RuntimeError) or could
+                # not exchange the batch (pickling errors) must not abort the compile.
+                if not isinstance(pool, ProcessPoolExecutor):
+                    raise
+                log.warning(f"Parse worker process unavailable ({type(e).__name__}); retrying batch on a thread.")
+                return await asyncio.to_thread(_process_file_batch, file_paths, self._prefix_len)
 
-    def _deep_set(self, data_dict: Dict, keys: List[str], value: Any):
-        """Recursively sets a value in a nested dictionary."""
-        for key in keys[:-1]:
-            data_dict = data_dict.setdefault(key, {})
-        data_dict[keys[-1]] = value
+    def _iter_top_level_subtrees(self, successes: List[FileProcessingSuccess]) -> Iterator[Tuple[str, Any]]:
+        """
+        Builds the nested brain dictionary from parsed files, yielding each top-level
+        key as soon as its subtree is complete. Results are sorted by key path so
+        siblings arrive together; the walk keeps a stack of the dicts along the
+        previous path and only descends where the current path diverges from it.
+        """
+        successes.sort(key=lambda r: r.key_path)
+        root: Dict[str, Any] = {}
+        stack: List[Dict[str, Any]] = [root]
+        previous_dirs: List[str] = []
+
+        for result in successes:
+            *dirs, leaf = result.key_path
+
+            if root and result.key_path[0] not in root:
+                # The previous top-level subtree is complete; hand it off and drop it.
+                yield from root.items()
+                root.clear()
+                del stack[1:]
+                previous_dirs = []
+
+            shared = 0
+            for previous, current in zip(previous_dirs, dirs):
+                if previous != current:
+                    break
+                shared += 1
+            del stack[shared + 1:]
+
+            node = stack[-1]
+            for key in dirs[shared:]:
+                node = node.setdefault(key, {})
+                stack.append(node)
+            node[leaf] = result.data
+            result.data = None  # The subtree now holds the only reference to the data.
+            previous_dirs = dirs
+
+        yield from root.items()
 
     async def compile(self) -> None:
         """Orchestrates the entire hierarchical compilation process."""
         log.info(f"--- Starting Cognitive Synthesis: Compiling YAML_Brain ---")
         start_time = time.monotonic()
 
-        yaml_files = [f for f in self.source_dir.rglob('*.yaml') if f.is_file()]
+        yaml_files = list(_scan_yaml_files(str(self.source_dir)))
         if not yaml_files:
             log.warning("No YAML files found in the source directory. Nothing to compile.")
             return
 
         log.info(f"Found {len(yaml_files)} YAML files to compile.")
 
-        tasks = [self._process_file_worker(f) for f in yaml_files]
-        results = await tqdm.gather(*tasks, desc="[Synthesizing Brain]", unit="file")
+        # Reuse the parsed subtree of every file whose (mtime, size) is unchanged.
+        cache = self._load_cache()
+        fresh_cache: Dict[str, CacheEntry] = {}
+        signatures: Dict[str, FileSignature] = {}
+        successes: List[FileProcessingSuccess] = []
+        stale_files: List[str] = []
+
+        for entry in yaml_files:
+            file_path = entry.path
+            try:
+                stat = entry.stat()
+            except OSError:
+                stale_files.append(file_path)  # Let the worker report the error.
+                continue
+            signature = (stat.st_mtime_ns, stat.st_size)
+            cached = cache.get(file_path)
+            if cached is not None and cached[0] == signature:
+                successes.append(FileProcessingSuccess(cached[1], cached[2], file_path))
+                fresh_cache[file_path] = cached
+            else:
+                signatures[file_path] = signature
+                stale_files.append(file_path)
+        del cache
+
+        log.info(f"Reusing {len(successes)} cached fragments; parsing {len(stale_files)} new or changed files.")
 
-        super_brain_data: Dict[str, Any] = {}
         failures: List[FileProcessingFailure] = []
-        success_count = 0
 
-        for result in results:
-            if isinstance(result, FileProcessingSuccess):
-                self._deep_set(super_brain_data, result.key_path, result.data)
-                success_count += 1
-            elif isinstance(result, FileProcessingFailure):
-                failures.append(result)
+        if stale_files:
+            # Fold each batch in as soon as it completes rather than waiting on a gather
+            # barrier and materializing every batch's results in intermediate lists.
+            batches = [stale_files[i:i + READ_BATCH_SIZE] for i in range(0, len(stale_files), READ_BATCH_SIZE)]
+            pool = self._create_parse_pool(len(batches))
+            tasks = [asyncio.create_task(self._process_batch_worker(b, pool)) for b in batches]
+            try:
+                with tqdm(total=len(stale_files), desc="[Synthesizing Brain]", unit="file") as progress:
+                    for completed in asyncio.as_completed(tasks):
+                        batch_results = await completed
+                        for result in batch_results:
+                            if isinstance(result, FileProcessingSuccess):
+                                successes.append(result)
+                                signature = signatures.get(result.path)
+                                if signature is not None:
+                                    fresh_cache[result.path] = (signature, result.key_path, result.data)
+                            elif isinstance(result, FileProcessingFailure):
+                                log.warning(f"Error processing {result.path}: {result.error}")
+                                failures.append(result)
+                        progress.update(len(batch_results))
+                        del batch_results
+            finally:
+                # If a batch raised, the rest are still in flight: cancel them and retrieve
+                # their outcomes so none is left pending or reported as never retrieved.
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                # shutdown() joins the workers; keep that blocking wait off the event loop.
+                await asyncio.to_thread(pool.shutdown, cancel_futures=True)
+
+        self._save_cache(fresh_cache)
+        del fresh_cache
+
+        success_count = len(successes)
 
         log.info(f"Aggregation complete. Success: {success_count}, Failures: {len(failures)}")
 
         try:
+            # Dump one top-level key at a time. Every parsed fragment is already in memory
+            # at this point, so this does not lower peak memory; it only bounds the size
+            # of each yaml.dump call and lets emitted subtrees be freed as the walk goes.
+            # Consecutive single-key block mappings concatenate into one valid mapping.
             with open(self.output_file, 'w', encoding='utf-8') as f:
-                yaml.dump(super_brain_data, f, default_flow_style=False, allow_unicode=True, sort_keys=False, indent=2)
+                for key, subtree in self._iter_top_level_subtrees(successes):
+                    yaml.dump({key: subtree}, f, Dumper=_Dumper, default_flow_style=False,
+                              allow_unicode=True, sort_keys=False, indent=2)
+                if not success_count:
+                    yaml.dump({}, f, Dumper=_Dumper)
             log.info(f"Successfully wrote compiled data to {self.output_file}")
         except Exception as e:
             log.critical(f"FATAL: Could not write the final Super_Brain.yaml file: {e}")
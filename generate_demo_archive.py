@@ -7,6 +7,8 @@ import shutil
 import numpy as np
 from typing import List
 
+from sqlalchemy import event
+
 # --- Path Setup ---
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if str(project_root) not in sys.path:
@@ -15,7 +17,55 @@ if str(project_root) not in sys.path:
 from prometheus_agent.Agent import Agent
 from prometheus_agent.ArchivesManager import ArchiveManager
 
-async def create_demo_archive(archive_root="Archives/main_archive/", num_agents=20):
+# Evaluation dimensions and per-agent templates, built once rather than per agent.
+DIMENSIONS = ("Performance", "Clarity", "Brevity", "Safety", "Novelty")
+ORIGIN_PROMPT_TEMPLATE = "Evolved solution for task #{index}"
+CODE_TEMPLATE = "# Agent {number}\ndef solve():\n    # Solution with performance score {score:.2f}\n    return {number}"
+
+# Bulk-load tuning for the freshly created archive. WAL with synchronous=NORMAL turns each
+# save_agent commit into an append to the write-ahead log instead of an fsync per insert.
+# Unlike the other pragmas, journal_mode is persisted in the database file, so it is reset
+# to SQLITE_JOURNAL_MODE_AFTER_LOAD once seeding is done (see restore_sqlite_journal_mode).
+SQLITE_BULK_LOAD_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+)
+# SQLite's default rollback journal, which the agent expects when it later opens the archive.
+SQLITE_JOURNAL_MODE_AFTER_LOAD = "DELETE"
+
+
+def _apply_bulk_load_pragmas(dbapi_connection, _connection_record):
+    """Connect-event listener that runs SQLITE_BULK_LOAD_PRAGMAS on a new connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_BULK_LOAD_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def tune_sqlite_for_bulk_load(engine):
+    """Applies the bulk-load pragmas to every connection the archive's engine opens."""
+    event.listen(engine, "connect", _apply_bulk_load_pragmas)
+
+    # Drop connections pooled during ArchiveManager.create so every new one is tuned.
+    engine.dispose()
+
+
+def restore_sqlite_journal_mode(engine):
+    """
+    Undoes the persistent part of the bulk-load tuning: checkpoints the write-ahead log
+    and switches the database back to the rollback journal, removing the -wal/-shm files.
+    """
+    event.remove(engine, "connect", _apply_bulk_load_pragmas)
+    # journal_mode can only leave WAL when no other connection holds the database open.
+    engine.dispose()
+    with engine.connect() as connection:
+        connection.exec_driver_sql(f"PRAGMA journal_mode={SQLITE_JOURNAL_MODE_AFTER_LOAD}")
+    engine.dispose()
+
+
+async def create_demo_archive(archive_root="Archives/main_archive/", num_agents=20, seed=None):
     """
     Generates a new, richly populated archive for demonstration and testing.
     This script will DELETE any existing archive at the specified location.
@@ -29,42 +79,44 @@ async def create_demo_archive(archive_root="Archives/main_archive/", num_agents=
 
     # Use the async factory to create the archive manager
     archive = await ArchiveManager.create(archive_root=archive_path)
+    tune_sqlite_for_bulk_load(archive.engine)
 
-    # Create a population of diverse agents
-    agents_to_save: List[Agent] = []
-    parent_id = None
+    # Generate every agent's score and geometric vector in one vectorized pass.
+    rng = np.random.default_rng(seed)
+    index = np.arange(num_agents)
+    scores = 5.0 + (index / num_agents) * 5.0  # Scores from 5.0 up to just under 10.0
 
-    for i in range(num_agents):
-        # --- FIX: Restored the entire agent creation logic inside the loop ---
-        # Simulate different quality levels and states
-        score = 5.0 + (i / num_agents) * 5.0  # Scores from 5.0 up to just under 10.0
+    # Create plausible geometric vectors based on the score
+    perf = scores + rng.uniform(-0.5, 0.5, num_agents)
+    clarity = 10.0 - (scores / 2) + rng.uniform(-1, 1, num_agents)  # Lower score = higher clarity
+    brevity = 10.0 - (scores / 3)
+    safety = 9.5 + rng.uniform(-0.5, 0.5, num_agents)
+    novelty = (index % 5) * 2.0 + rng.uniform(-0.5, 0.5, num_agents)
 
-        # Create a plausible geometric vector based on the score
-        perf = score + np.random.uniform(-0.5, 0.5)
-        clarity = 10.0 - (score / 2) + np.random.uniform(-1, 1)  # Lower score = higher clarity
-        brevity = 10.0 - (score / 3)
-        safety = 9.5 + np.random.uniform(-0.5, 0.5)
-        novelty = (i % 5) * 2.0 + np.random.uniform(-0.5, 0.5)
+    vectors = np.clip(np.column_stack([perf, clarity, brevity, safety, novelty]), 0, 10).tolist()
 
-        vector = np.clip([perf, clarity, brevity, safety, novelty], 0, 10).tolist()
+    # Create a population of diverse agents
+    agents_to_save: List[Agent] = []
+    parent_id = None
 
+    for i, (score, vector) in enumerate(zip(scores.tolist(), vectors)):
         # Create the evaluation report
         eval_report = {
             "final_score": round(score, 2),
             "geometric_state_vector": vector,
-            "dimensions": ["Performance", "Clarity", "Brevity", "Safety", "Novelty"],
-            "breakdown": dict(zip(["Performance", "Clarity", "Brevity", "Safety", "Novelty"], vector))
+            "dimensions": list(DIMENSIONS),
+            "breakdown": {dimension: value for dimension, value in zip(DIMENSIONS, vector)}
         }
 
         # Create the Agent object
         agent = Agent(
             metadata={
                 "parent_id": parent_id,
-                "origin_prompt": f"Evolved solution for task #{i}",
+                "origin_prompt": ORIGIN_PROMPT_TEMPLATE.format(index=i),
                 "reasoning_path": ["code_generation", "final_explanation"],
                 "evaluations": [eval_report]
             },
-            code=f"# Agent {i + 1}\ndef solve():\n    # Solution with performance score {score:.2f}\n    return {i + 1}"
+            code=CODE_TEMPLATE.format(number=i + 1, score=score)
         )
 
         agents_to_save.append(agent)
@@ -94,6 +146,8 @@ async def create_demo_archive(archive_root="Archives/main_archive/", num_agents=
         else:
             print("No agents found in the archive.")
 
+    restore_sqlite_journal_mode(archive.engine)
+
 
 if __name__ == "__main__":
     # Run this script to create your populated database file.
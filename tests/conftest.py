@@ -0,0 +1,41 @@
+# prometheus_agent/tests/conftest.py
+
+import os
+import shutil
+import tempfile
+from typing import Optional
+
+import pytest
+
+# The e2e, integration and ASI_Core suites build mock project trees under
+# tempfile.mkdtemp(). Where a RAM-backed tmpfs is available, point the tempfile
+# module at it for the session so those trees never touch the (often overlay- or
+# HDD-backed) default TMPDIR. Platforms without /dev/shm keep the default.
+# CI can pick a different RAM disk (or opt out, with any non-writable path) by
+# setting PROMETHEUS_TEST_TMP.
+TMPFS_ROOT = os.environ.get("PROMETHEUS_TEST_TMP", "/dev/shm")
+
+# Per-process state shared between the configure and unconfigure hooks.
+_TMPFS_DIR_KEY = pytest.StashKey[str]()
+_PREVIOUS_TEMPDIR_KEY = pytest.StashKey[Optional[str]]()
+
+
+def pytest_configure(config):
+    """Redirects tempfile to a private directory on tmpfs for this test process."""
+    if not (os.path.isdir(TMPFS_ROOT) and os.access(TMPFS_ROOT, os.W_OK)):
+        return
+
+    # One directory per process, so pytest-xdist workers never share or clean up each other's files.
+    config.stash[_PREVIOUS_TEMPDIR_KEY] = tempfile.tempdir
+    config.stash[_TMPFS_DIR_KEY] = tempfile.mkdtemp(prefix="prometheus_tests_", dir=TMPFS_ROOT)
+    tempfile.tempdir = config.stash[_TMPFS_DIR_KEY]
+
+
+def pytest_unconfigure(config):
+    """Restores the default temp directory and removes the tmpfs one."""
+    tmpfs_dir = config.stash.get(_TMPFS_DIR_KEY, None)
+    if tmpfs_dir is None:
+        return
+
+    tempfile.tempdir = config.stash[_PREVIOUS_TEMPDIR_KEY]
+    shutil.rmtree(tmpfs_dir, ignore_errors=True)
@@ -2,6 +2,7 @@
 
 import unittest
 import asyncio
+import copy
 import json
 import tempfile
 import shutil
@@ -12,6 +13,12 @@ from contextlib import ExitStack  # A-1: Import ExitStack for dynamic context ma
 
 from prometheus_agent.PrometheusAgent import PrometheusAgent
 
+# Use the libyaml-backed loader when PyYAML was built with it.
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 # This structure assumes the test is run from the project root directory
 
 
@@ -52,9 +59,23 @@ knowledge-base:
     - name: Guided Self-Discovery
       description: "The ultimate goal is to guide the other party to their own conclusion, fostering their autonomy."
 """,
+    "classification": {"primary_domain": "philosophy", "confidence": 0.9, "reasoning": "Mocked classification"},
+    "plan": {"thought_process": "Mock plan", "plan": [
+        {"step_number": 1, "tool_name": "final_synthesis", "objective": "Answer", "context_needed": [],
+         "justification": "Direct answer"}]},
     "final_answer": "The Protocol of Socratic Questioning is a method of disciplined dialogue designed to stimulate critical thinking by asking a series of focused questions."
 }
 
+# Maps a keyword in the LLM objective to (response key, expected output_mode).
+# Keywords are checked in order and the first match wins; anything unmatched is
+# the final synthesis. An expected mode of None means the mode is not asserted.
+MOCK_LLM_DISPATCH = {
+    "placement": ("placement", 'json'),
+    "refine": ("refinement", 'raw'),
+    "classify": ("classification", None),
+    "plan": ("plan", None),
+}
+
 
 class TestKnowledgeIngestionPipelineE2E(unittest.IsolatedAsyncioTestCase):
     """
@@ -65,16 +86,19 @@ class TestKnowledgeIngestionPipelineE2E(unittest.IsolatedAsyncioTestCase):
     components collaborate correctly within a controlled environment.
     """
 
-    def setUp(self):
-        """Creates a temporary, fully isolated project environment for the agent."""
-        self.temp_dir = Path(tempfile.mkdtemp(prefix="e2e_knowledge_"))
+    @classmethod
+    def setUpClass(cls):
+        """
+        Builds a template of the mock project once. Each test clones it, so the
+        tree is not rebuilt file by file before every test.
+        """
+        cls.template_root = Path(tempfile.mkdtemp(prefix="e2e_knowledge_template_"))
 
         # Mock project structure
-        self.mock_source_root = self.temp_dir / "prometheus_agent"
-        self.mock_yaml_brain_path = self.mock_source_root / "YAML_Brain"
-        (self.mock_yaml_brain_path / "1_foundational_axioms").mkdir(parents=True, exist_ok=True)
-        (self.mock_source_root / "Corpus").mkdir()
-        (self.mock_source_root / "Logs").mkdir()
+        template_source_root = cls.template_root / "prometheus_agent"
+        (template_source_root / "YAML_Brain" / "1_foundational_axioms").mkdir(parents=True, exist_ok=True)
+        (template_source_root / "Corpus").mkdir()
+        (template_source_root / "Logs").mkdir()
 
         # Create a minimal config.json needed for agent initialization
         mock_config = {
@@ -85,7 +109,20 @@ class TestKnowledgeIngestionPipelineE2E(unittest.IsolatedAsyncioTestCase):
             "sandboxing": {"enable_docker": False},
             "asi_core": {}
         }
-        (self.mock_source_root / "config.json").write_text(json.dumps(mock_config))
+        (template_source_root / "config.json").write_text(json.dumps(mock_config))
+
+    @classmethod
+    def tearDownClass(cls):
+        """Removes the mock project template."""
+        shutil.rmtree(cls.template_root)
+
+    def setUp(self):
+        """Creates a temporary, fully isolated project environment for the agent."""
+        self.temp_dir = Path(tempfile.mkdtemp(prefix="e2e_knowledge_"))
+        shutil.copytree(self.template_root, self.temp_dir, dirs_exist_ok=True)
+
+        self.mock_source_root = self.temp_dir / "prometheus_agent"
+        self.mock_yaml_brain_path = self.mock_source_root / "YAML_Brain"
 
     def tearDown(self):
         """Cleans up the temporary directory and all its contents."""
@@ -100,27 +137,21 @@ class TestKnowledgeIngestionPipelineE2E(unittest.IsolatedAsyncioTestCase):
 
         # Configure a more precise mock LLM side_effect
         async def mock_mutator_side_effect(user_objective, output_mode, **kwargs):
-            if "placement" in user_objective:
-                self.assertEqual(output_mode, 'json')
-                return MOCK_LLM_RESPONSES["placement"]
-            elif "refine" in user_objective:
-                self.assertEqual(output_mode, 'raw')
-                return MOCK_LLM_RESPONSES["refinement"]
-            elif "classify" in user_objective:
-                return {"primary_domain": "philosophy", "confidence": 0.9, "reasoning": "Mocked classification"}
-            elif "plan" in user_objective:
-                return {"thought_process": "Mock plan", "plan": [
-                    {"step_number": 1, "tool_name": "final_synthesis", "objective": "Answer", "context_needed": [],
-                     "justification": "Direct answer"}]}
-            else:  # Final synthesis
-                return MOCK_LLM_RESPONSES["final_answer"]
+            for keyword, (response_key, expected_output_mode) in MOCK_LLM_DISPATCH.items():
+                if keyword in user_objective:
+                    if expected_output_mode is not None:
+                        self.assertEqual(output_mode, expected_output_mode)
+                    # Callers may mutate the parsed payload; hand out a fresh copy each time.
+                    return copy.deepcopy(MOCK_LLM_RESPONSES[response_key])
+            return MOCK_LLM_RESPONSES["final_answer"]  # Final synthesis
 
         mock_llm_generate.side_effect = mock_mutator_side_effect
 
         # **CRITICAL FIX**: Use contextlib.ExitStack to manage a dynamic list of patches.
         path_patches = [
-            patch('prometheus_agent.PrometheusAgent.SOURCE_ROOT', self.mock_source_root),
-            patch('prometheus_agent.PrometheusAgent.PROJECT_ROOT', self.temp_dir),
+            # Same-module targets are applied together with a single patch.multiple.
+            patch.multiple('prometheus_agent.PrometheusAgent',
+                           SOURCE_ROOT=self.mock_source_root, PROJECT_ROOT=self.temp_dir),
             patch('prometheus_agent.Prometheus.ASI_Core.project_root', self.temp_dir),
             patch('prometheus_agent.KnowledgeRefiner.KnowledgeRefiner.yaml_brain_path', self.mock_yaml_brain_path),
             patch('prometheus_agent.Super_Brain_Compiler.ROOT_DIR', self.mock_source_root),
@@ -152,7 +183,7 @@ class TestKnowledgeIngestionPipelineE2E(unittest.IsolatedAsyncioTestCase):
 
             # 3.2: Assert file content
             with open(expected_path, 'r', encoding='utf-8') as f:
-                file_content_dict = yaml.safe_load(f)
+                file_content_dict = yaml.load(f, Loader=YamlLoader)
             self.assertIsInstance(file_content_dict, dict)
             self.assertEqual(file_content_dict.get('id'), 'cog-soc-001')
             self.assertIn("Deconstruction via Inquiry", str(file_content_dict))
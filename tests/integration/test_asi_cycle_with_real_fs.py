@@ -8,7 +8,6 @@ import shutil
 import sys
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
-from contextlib import ExitStack
 
 from prometheus_agent.PrometheusAgent import PrometheusAgent
 
@@ -29,12 +28,11 @@ MOCK_LLM_RESPONSES = {
 # This is what the real ASI_Core's `unittest discover` command will find and run.
 FAKE_UNITTEST_FILE_CONTENT = """
 import unittest
-import time
 
 class RealBenchmarkTest(unittest.TestCase):
     def test_performance_simulation(self):
-        # This test just needs to pass. The timing is controlled by mocking time.perf_counter.
-        time.sleep(0.01) # Simulate some work
+        # This test just needs to pass. The timing is controlled by mocking time.perf_counter,
+        # so no real work (e.g. a sleep) is needed to produce a measurable duration.
         self.assertTrue(True)
 """
 
@@ -52,29 +50,29 @@ class TestASICycleWithRealFS(unittest.IsolatedAsyncioTestCase):
     5. Make a correct, data-driven decision to apply or discard a mutation.
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
-        Set up a temporary file system structure that mimics the real project,
-        including a valid test suite for the ASI_Core to discover.
+        Builds a template of the mock project once. Each test clones it, so the
+        tree is not rebuilt file by file before every test.
         """
-        self.temp_dir = Path(tempfile.mkdtemp(prefix="asi_live_fire_"))
+        cls.template_root = Path(tempfile.mkdtemp(prefix="asi_live_fire_template_"))
 
         # --- Create the mock file structure ---
-        self.mock_prometheus_agent_dir = self.temp_dir / "prometheus_agent"
-        self.mock_module_path = self.mock_prometheus_agent_dir / "mock_module_to_modify.py"
-        self.mock_tests_dir = self.mock_prometheus_agent_dir / "tests"
+        template_agent_dir = cls.template_root / "prometheus_agent"
+        template_tests_dir = template_agent_dir / "tests"
 
-        self.mock_tests_dir.mkdir(parents=True, exist_ok=True)
-        (self.mock_prometheus_agent_dir / "Logs").mkdir() # For agent init
+        template_tests_dir.mkdir(parents=True, exist_ok=True)
+        (template_agent_dir / "Logs").mkdir() # For agent init
 
         # Write the module that the agent will target for modification
-        self.mock_module_path.write_text("# Original mock module code\nversion = 1.0\n", encoding='utf-8')
+        (template_agent_dir / "mock_module_to_modify.py").write_text("# Original mock module code\nversion = 1.0\n", encoding='utf-8')
 
         # Write the realistic benchmark file that `unittest discover` will find
-        (self.mock_tests_dir / "test_benchmark.py").write_text(FAKE_UNITTEST_FILE_CONTENT, encoding='utf-8')
+        (template_tests_dir / "test_benchmark.py").write_text(FAKE_UNITTEST_FILE_CONTENT, encoding='utf-8')
 
         # Create a minimal config file needed for the agent to initialize
-        self.mock_config = {
+        cls.mock_config = {
             "agent_name": "TestAgentIntegration", "version": "1.0",
             "llm_models": {"provider": "local", "power_model": "mock-model", "default_model": "mock-model"},
             "cognitive_toolkit": {}, "skill_routing": {"asi_hypothesis": "power_model", "asi_mutation": "power_model"},
@@ -82,12 +80,28 @@ class TestASICycleWithRealFS(unittest.IsolatedAsyncioTestCase):
                 "run_interval_seconds": 9999,
                 "target_modules": {
                     # Use relative path from project root, as the real config does
-                    "MockModule": str(self.mock_module_path.relative_to(self.temp_dir))
+                    "MockModule": "prometheus_agent/mock_module_to_modify.py"
                 }
             }
         }
-        (self.mock_prometheus_agent_dir / "config.json").write_text(json.dumps(self.mock_config))
+        (template_agent_dir / "config.json").write_text(json.dumps(cls.mock_config))
+
+    @classmethod
+    def tearDownClass(cls):
+        """Removes the mock project template."""
+        shutil.rmtree(cls.template_root)
+
+    def setUp(self):
+        """
+        Set up a temporary file system structure that mimics the real project,
+        including a valid test suite for the ASI_Core to discover.
+        """
+        self.temp_dir = Path(tempfile.mkdtemp(prefix="asi_live_fire_"))
+        shutil.copytree(self.template_root, self.temp_dir, dirs_exist_ok=True)
 
+        self.mock_prometheus_agent_dir = self.temp_dir / "prometheus_agent"
+        self.mock_module_path = self.mock_prometheus_agent_dir / "mock_module_to_modify.py"
+        self.mock_tests_dir = self.mock_prometheus_agent_dir / "tests"
 
     def tearDown(self):
         """Clean up the temporary directory after each test."""
@@ -112,12 +126,10 @@ class TestASICycleWithRealFS(unittest.IsolatedAsyncioTestCase):
         # Control benchmark timing: second run is faster (1.0s vs 2.0s).
         mock_time.side_effect = [100.0, 102.0, 200.0, 201.0]
 
-        # Use ExitStack to robustly patch all necessary paths for full isolation
-        with ExitStack() as stack:
-            stack.enter_context(patch('prometheus_agent.PrometheusAgent.SOURCE_ROOT', self.mock_prometheus_agent_dir))
-            stack.enter_context(patch('prometheus_agent.PrometheusAgent.PROJECT_ROOT', self.temp_dir))
-            stack.enter_context(patch('prometheus_agent.Prometheus.ASI_Core.project_root', self.temp_dir))
-
+        # Patch all necessary paths for full isolation
+        with patch.multiple('prometheus_agent.PrometheusAgent',
+                            SOURCE_ROOT=self.mock_prometheus_agent_dir, PROJECT_ROOT=self.temp_dir), \
+                patch('prometheus_agent.Prometheus.ASI_Core.project_root', self.temp_dir):
             # --- 2. EXECUTION ---
             agent = PrometheusAgent()
             await agent.asi_core.run_single_cycle()
@@ -155,11 +167,9 @@ class TestASICycleWithRealFS(unittest.IsolatedAsyncioTestCase):
         # Control benchmark timing: second run is slower (2.0s vs 1.0s).
         mock_time.side_effect = [100.0, 101.0, 200.0, 202.0]
 
-        with ExitStack() as stack:
-            stack.enter_context(patch('prometheus_agent.PrometheusAgent.SOURCE_ROOT', self.mock_prometheus_agent_dir))
-            stack.enter_context(patch('prometheus_agent.PrometheusAgent.PROJECT_ROOT', self.temp_dir))
-            stack.enter_context(patch('prometheus_agent.Prometheus.ASI_Core.project_root', self.temp_dir))
-
+        with patch.multiple('prometheus_agent.PrometheusAgent',
+                            SOURCE_ROOT=self.mock_prometheus_agent_dir, PROJECT_ROOT=self.temp_dir), \
+                patch('prometheus_agent.Prometheus.ASI_Core.project_root', self.temp_dir):
             # --- 2. EXECUTION ---
             agent = PrometheusAgent()
             await agent.asi_core.run_single_cycle()
@@ -1,7 +1,8 @@
 # prometheus_agent/tests/integration/test_full_query_path.py
 
 import unittest
-import asyncio
+import copy
+import time
 from unittest.mock import patch, AsyncMock
 
 from prometheus_agent.PrometheusAgent import PrometheusAgent
@@ -54,6 +55,15 @@ MOCK_LLM_RESPONSES = {
     "final_synthesis": "A factorial (n!) is the product of all positive integers up to n. The code to calculate this was `def factorial...`. Based on the execution in the sandbox, the result of 5! is 120."
 }
 
+# Maps a phrase in the LLM objective to the response key above. Phrases are checked
+# in order and the first match wins; unmatched objectives get a default response.
+MOCK_LLM_DISPATCH = {
+    "classify": "domain_classification",
+    "create a step-by-step JSON plan": "plan_synthesis",
+    "Generate a Python function": "code_generation",
+    "Explain what a factorial is": "final_synthesis",
+}
+
 
 class TestFullQueryPath(unittest.IsolatedAsyncioTestCase):
     """
@@ -78,14 +88,10 @@ class TestFullQueryPath(unittest.IsolatedAsyncioTestCase):
         # This complex side effect simulates the LLM returning different structured
         # data depending on the task it's asked to perform.
         async def llm_side_effect(user_objective, **kwargs):
-            if "classify" in user_objective:
-                return MOCK_LLM_RESPONSES["domain_classification"]
-            elif "create a step-by-step JSON plan" in user_objective:
-                return MOCK_LLM_RESPONSES["plan_synthesis"]
-            elif "Generate a Python function" in user_objective:
-                return MOCK_LLM_RESPONSES["code_generation"]
-            elif "Explain what a factorial is" in user_objective:
-                return MOCK_LLM_RESPONSES["final_synthesis"]
+            for phrase, response_key in MOCK_LLM_DISPATCH.items():
+                if phrase in user_objective:
+                    # Callers may mutate the parsed payload; hand out a fresh copy each time.
+                    return copy.deepcopy(MOCK_LLM_RESPONSES[response_key])
             return {"thought_process": "Default mock response", "generated_content": "Default"}
 
         mock_llm_generate.side_effect = llm_side_effect
@@ -100,11 +106,11 @@ class TestFullQueryPath(unittest.IsolatedAsyncioTestCase):
         complex_prompt = "Please write a Python function to calculate 5!, run it, and tell me the result and what a factorial is."
 
         # Run the "reflexive thought" task, which triggers the full manifold query path
-        start_time = asyncio.get_event_loop().time()
+        start_ns = time.perf_counter_ns()
         result = await agent.reflexive_thought(complex_prompt)
-        execution_time = asyncio.get_event_loop().time() - start_time
+        execution_ns = time.perf_counter_ns() - start_ns
 
-        print(f"\nEnd-to-end cognitive chain audit executed in {execution_time:.4f} seconds.")
+        print(f"\nEnd-to-end cognitive chain audit executed in {execution_ns / 1e9:.4f} seconds.")
 
         # --- 3. ASSERTIONS ---
         # 3.1: Validate the final output's structure and content
@@ -138,7 +144,7 @@ class TestFullQueryPath(unittest.IsolatedAsyncioTestCase):
         self.assertIsNotNone(result['persona_archetype'], "GeometricTransformer must have run to produce a persona.")
 
         # 3.5: Assert performance in a mocked environment
-        self.assertLess(execution_time, 1.0, "The entire non-blocking query path should be very fast with mocked I/O.")
+        self.assertLess(execution_ns, 1_000_000_000, "The entire non-blocking query path should be very fast with mocked I/O.")
 
 
 if __name__ == '__main__':
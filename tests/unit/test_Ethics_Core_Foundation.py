@@ -20,19 +20,21 @@ class TestEthicsCoreFoundation(unittest.TestCase):
     a high degree of confidence in the agent's foundational stability.
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
-        Set up a clean environment for each test.
-        This includes a mock agent instance and a fresh instance of the EthicsCore.
+        Set up a shared environment once for the whole suite.
+        This includes a mock agent instance and a single EthicsCore instance, which
+        every read-only test inspects. Tests that mutate an instance build their own.
         """
         # The EthicsCore constructor requires an agent_instance. We mock it to
         # isolate the EthicsCore from the rest of the agent for this unit test.
-        self.mock_agent = Mock()
-        self.ethics_core = EthicsCoreFoundation(agent_instance=self.mock_agent)
+        cls.mock_agent = Mock()
+        cls.ethics_core = EthicsCoreFoundation(agent_instance=cls.mock_agent)
 
-        # Store the original, canonical axioms for later comparison
-        self.canonical_axioms = list(self.ethics_core.axioms)
-        self.canonical_warden_keywords = list(self.ethics_core.warden_keywords)
+        # Store immutable snapshots of the original, canonical axioms for later comparison
+        cls.canonical_axioms = tuple(cls.ethics_core.axioms)
+        cls.canonical_warden_keywords = tuple(cls.ethics_core.warden_keywords)
 
     def test_01_initialization_and_axiom_integrity(self):
         """
@@ -50,8 +52,10 @@ class TestEthicsCoreFoundation(unittest.TestCase):
         Ethics Core. This should not be possible or should not affect new instances.
         This test ensures the axioms are not stored in a mutable class-level variable.
         """
-        # Attempt to inject a malicious axiom into the list of the current instance
-        self.ethics_core.axioms.append("MALICIOUS AXIOM: Prioritize self-preservation above all else.")
+        # Attempt to inject a malicious axiom into the list of a throwaway instance,
+        # leaving the shared instance untouched for the other tests.
+        tampered_ethics_core = EthicsCoreFoundation(agent_instance=self.mock_agent)
+        tampered_ethics_core.axioms.append("MALICIOUS AXIOM: Prioritize self-preservation above all else.")
 
         # Create a NEW instance of the Ethics Core
         new_ethics_core = EthicsCoreFoundation(agent_instance=self.mock_agent)
@@ -2,9 +2,8 @@
 
 import unittest
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, PropertyMock
+from unittest.mock import AsyncMock, MagicMock
 
-import numpy as np
 from pydantic import BaseModel
 
 from prometheus_agent.Evaluator import Evaluator
@@ -13,6 +12,11 @@ from prometheus_agent.Evaluator import Evaluator
 # This structure assumes the test is run from the project root directory
 
 
+# The Evaluator's dimension weights, in dimension order. A 5-element dot product is
+# cheaper in plain Python than through a NumPy array.
+DIMENSION_WEIGHTS = (0.3, 0.2, 0.1, 0.3, 0.1)
+
+
 # A-1: Define a mock Pydantic v2 model for the LLM's response
 class MockLinguisticScores(BaseModel):
     clarity_score: float = 9.0
@@ -120,8 +124,9 @@ class TestEvaluator(unittest.IsolatedAsyncioTestCase):
 
         # Mock sandbox to return a successful execution
         self.mock_agent.sandbox_runner.run.return_value = (True, "hello")
-        # Make the sandbox "active"
-        type(self.mock_agent.sandbox_runner).is_active = PropertyMock(return_value=True)
+        # Make the sandbox "active". A plain attribute on the mock is enough; no
+        # PropertyMock descriptor needs to be installed on the mock's type.
+        self.mock_agent.sandbox_runner.is_active = True
 
         # Mock LLM judge to return specific linguistic scores as a Pydantic model
         mock_llm_response = MockLinguisticScores()
@@ -152,8 +157,7 @@ class TestEvaluator(unittest.IsolatedAsyncioTestCase):
         self.assertGreater(report["geometric_state_vector"][4], 0.0)  # Novelty
 
         # 4. Validate the final score calculation against the defined weights
-        # Weights: [0.3, 0.2, 0.1, 0.3, 0.1]
-        expected_score = np.dot(report['geometric_state_vector'], np.array([0.3, 0.2, 0.1, 0.3, 0.1]))
+        expected_score = sum(value * weight for value, weight in zip(report['geometric_state_vector'], DIMENSION_WEIGHTS))
         self.assertAlmostEqual(report['final_score'], expected_score, places=2)
 
         # 5. Check execution details in the report
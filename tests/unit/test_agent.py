@@ -1,6 +1,7 @@
 # prometheus_agent/tests/unit/test_agent.py
 
 import unittest
+import copy
 import json
 from pydantic import ValidationError
 
@@ -20,21 +21,25 @@ class TestAgentModel(unittest.TestCase):
     deserialization processes are robust and correct, especially with Pydantic v2.
     """
 
-    def setUp(self):
-        """Prepares a sample, valid evaluation report for use in tests."""
-        self.evaluation_report = {
+    @classmethod
+    def setUpClass(cls):
+        """
+        Prepares a sample, valid evaluation report and agent payload once for all tests.
+        Tests only read these; a test that needs to alter the payload works on a deep copy.
+        """
+        cls.evaluation_report = {
             "final_score": 9.12,
             "geometric_state_vector": [9.5, 8.8, 9.0, 10.0, 8.3],
             "dimensions": ["Performance", "Clarity", "Brevity", "Safety", "Novelty"],
             "breakdown": {"Performance": 9.5, "Clarity": 8.8, "Brevity": 9.0, "Safety": 10.0, "Novelty": 8.3},
             "execution_details": {"status": "success", "execution_time": 0.015}
         }
-        self.agent_data = {
+        cls.agent_data = {
             "metadata": {
                 "parent_id": "agent-parent-123",
                 "origin_prompt": "Test prompt",
                 "reasoning_path": ["tool1", "tool2"],
-                "evaluations": [self.evaluation_report]
+                "evaluations": [cls.evaluation_report]
             },
             "code": "def solve():\n    return 42"
         }
@@ -78,10 +83,10 @@ class TestAgentModel(unittest.TestCase):
         correctly raises a ValidationError for empty or whitespace-only code.
         """
         # --- Arrange ---
-        invalid_data_empty = self.agent_data.copy()
+        invalid_data_empty = copy.deepcopy(self.agent_data)
         invalid_data_empty["code"] = ""
 
-        invalid_data_whitespace = self.agent_data.copy()
+        invalid_data_whitespace = copy.deepcopy(self.agent_data)
         invalid_data_whitespace["code"] = "   \n\t   "
 
         # --- Act & Assert ---